@@ -0,0 +1,106 @@
+import math
+import re
+from datetime import datetime, timedelta
+
+# Phone number formatting and per-recipient reminder digests for the SMS backend.
+# Kept free of Twilio/Flask so the digesting can be run against a fake sender.
+
+# GSM 03.38 character sets: basic characters take one septet, extended ones take two (escape + char)
+GSM7_BASIC = set(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+GSM7_EXTENDED = set("\f^{}\\[~]|€")
+
+
+def format_phone_number(phone_number):
+    """ Ensure phone number has +91 and is valid """
+    phone_number = phone_number.strip()
+
+    # Add +91 if missing
+    if not phone_number.startswith("+91"):
+        phone_number = "+91" + phone_number
+
+    # Validate number format (should be +91 followed by 10 digits)
+    if not re.match(r"^\+91[6-9]\d{9}$", phone_number):
+        raise ValueError("Invalid Indian phone number format. Use +91XXXXXXXXXX.")
+
+    return phone_number
+
+
+def sms_segments(message):
+    """ Number of SMS segments `message` needs (GSM-7 if every character allows it, UCS-2 otherwise) """
+    if all(char in GSM7_BASIC or char in GSM7_EXTENDED for char in message):
+        units = sum(2 if char in GSM7_EXTENDED else 1 for char in message)
+        single, multi = 160, 153
+    else:
+        units = len(message.encode("utf-16-le")) // 2  # Characters outside the BMP (emoji) take two units
+        single, multi = 70, 67
+    return 1 if units <= single else math.ceil(units / multi)
+
+
+def collect_due_reminders(tasks, now, window_minutes):
+    """ Group reminders that are due now with ones due within `window_minutes`, per phone number """
+    current_datetime = now.replace(second=0, microsecond=0)
+    window_end = current_datetime + timedelta(minutes=window_minutes)
+    upcoming = {}
+
+    for task in tasks:
+        if (task["reminder"] and
+            task["date"] != "Not specified" and
+            task["time"] and
+            task.get("phone") and  # Fixed: Check if phone exists
+            task["status"] != "completed" and  # Fixed: Don't remind for completed tasks
+            not task.get("notified", False)):
+
+            task_datetime_str = f"{task['date']} {task['time']}"
+            try:
+                task_datetime = datetime.strptime(task_datetime_str, "%Y-%m-%d %H:%M")
+                reminder_datetime = task_datetime - timedelta(minutes=10)  # Send reminder 10 mins before task
+
+                if current_datetime <= reminder_datetime < window_end:
+                    formatted_phone = format_phone_number(task["phone"])
+                    upcoming.setdefault(formatted_phone, []).append((reminder_datetime, task))
+            except ValueError as e:
+                print(f"Invalid reminder data for task {task['id']}: {e}")
+
+    # Only numbers with a reminder due right now get a digest; the rest wait for their own minute
+    return {
+        phone: [task for _, task in sorted(entries, key=lambda entry: entry[0])]
+        for phone, entries in upcoming.items()
+        if any(reminder_datetime == current_datetime for reminder_datetime, _ in entries)
+    }
+
+
+def build_reminder_digests(due_tasks, max_segments):
+    """ Render reminders into as few SMS messages as fit in `max_segments` segments each """
+    if len(due_tasks) == 1:
+        task = due_tasks[0]
+        return [(f"Reminder: {task['task']} is scheduled at {task['time']} on {task['date']}.", due_tasks)]
+
+    # Name the date once in the header when every reminder is on the same day
+    same_day = len({task["date"] for task in due_tasks}) == 1
+    header = f"Reminders for {due_tasks[0]['date']}:" if same_day else "Reminders:"
+    digests = []
+    lines, batch = [header], []
+    for task in due_tasks:
+        line = f"- {task['time']} {task['task']}" if same_day else f"- {task['time']} {task['task']} ({task['date']})"
+        if batch and sms_segments("\n".join(lines + [line])) > max_segments:
+            digests.append(("\n".join(lines), batch))
+            lines, batch = [header], []
+        lines.append(line)
+        batch.append(task)
+    digests.append(("\n".join(lines), batch))
+    return digests
+
+
+def send_reminder_digests(tasks, now, send, window_minutes=10, max_segments=2):
+    """ Send one digest per phone number with `send(phone, message)`, marking delivered tasks as notified """
+    sent = 0
+    for phone, due_tasks in collect_due_reminders(tasks, now, window_minutes).items():
+        for message, batch in build_reminder_digests(due_tasks, max_segments):
+            sent += 1
+            if send(phone, message):
+                for task in batch:
+                    task["notified"] = True  # Mark task as notified
+    return sent
@@ -0,0 +1,50 @@
+"""Throughput of the rule-based date/time normalizer on the chatbot dataset.
+
+Run from the repo root: python benchmarks/bench_date_normalizer.py
+If spaCy and en_core_web_sm are installed, the same messages are timed through spaCy for comparison.
+"""
+import csv
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, os.path.join(ROOT, "final_chatbot"))
+
+from date_normalizer import needs_fallback, normalize
+
+REPEAT = 2000
+
+
+def load_messages():
+    with open(os.path.join(ROOT, "daily_planner_chatbot_dataset_extended.csv"), encoding="utf-8") as f:
+        return [row["User Input"] for row in csv.DictReader(f)]
+
+
+def per_message_us(func, messages):
+    start = time.perf_counter()
+    for message in messages:
+        func(message)
+    return (time.perf_counter() - start) / len(messages) * 1e6
+
+
+def main():
+    messages = load_messages()
+    fallback = [m for m in messages if not (normalize(m)["DATE"] or normalize(m)["TIME"]) and needs_fallback(m)]
+    print(f"dataset messages: {len(messages)}, needing the spaCy fallback: {len(fallback)}")
+
+    rules_us = per_message_us(normalize, messages * REPEAT)
+    print(f"rules: {rules_us:.1f} us/message ({1e6 / rules_us:,.0f} messages/s)")
+
+    try:
+        import spacy
+        nlp = spacy.load("en_core_web_sm")
+    except (ImportError, OSError):
+        print("spaCy/en_core_web_sm not installed, skipping the comparison")
+        return
+    spacy_us = per_message_us(nlp, messages * 20)
+    print(f"spaCy: {spacy_us:.1f} us/message ({1e6 / spacy_us:,.0f} messages/s)")
+
+
+if __name__ == "__main__":
+    main()
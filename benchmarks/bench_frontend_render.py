@@ -0,0 +1,95 @@
+"""Time the Streamlit frontend against a stub API with large task lists.
+
+Run from the repo root: python benchmarks/bench_frontend_render.py [--baseline REV] [--tasks 300 1000]
+Needs streamlit, flask, pandas and requests; port 5000 (the frontend's API_URL) must be free.
+--baseline also times final_chatbot/frontend.py as it was at a git revision, e.g. the commit before the fragments change.
+"""
+import argparse
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+import time
+
+from flask import Flask, jsonify
+from streamlit.testing.v1 import AppTest
+from werkzeug.serving import make_server
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+FRONTEND = os.path.join(ROOT, "final_chatbot", "frontend.py")
+
+stub_tasks = []
+
+
+def make_tasks(count):
+    return [{
+        "id": i,
+        "task": f"Task {i}",
+        "date": "2030-10-20",
+        "time": "09:00",
+        "priority": "High",
+        "reminder": i % 5 == 0,
+        "status": "pending",
+        "created_at": "2030-10-19 08:00:00"
+    } for i in range(1, count + 1)]
+
+
+def start_stub_api():
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)  # Keep request logs out of the results
+    app = Flask(__name__)
+    app.add_url_rule("/schedule", "schedule", lambda: jsonify({"tasks": stub_tasks}))
+    app.add_url_rule("/reminders", "reminders", lambda: jsonify({"reminders": [t for t in stub_tasks if t["reminder"]]}))
+    server = make_server("127.0.0.1", 5000, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def time_script(path):
+    app = AppTest.from_file(path, default_timeout=600)
+    start = time.perf_counter()
+    app.run()
+    first = time.perf_counter() - start
+    if app.exception:
+        raise RuntimeError(f"{path} raised: {app.exception[0].message}")
+    start = time.perf_counter()
+    app.run()  # A rerun with the same state, as after a button click
+    rerun = time.perf_counter() - start
+    return first, rerun, len(app.button)
+
+
+def baseline_script(revision):
+    source = subprocess.run(["git", "-C", ROOT, "show", f"{revision}:final_chatbot/frontend.py"],
+                            check=True, capture_output=True, text=True).stdout
+    handle, path = tempfile.mkstemp(suffix=".py")
+    with os.fdopen(handle, "w", encoding="utf-8") as f:
+        f.write(source)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baseline", help="git revision whose frontend.py to time as well")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[300, 1000])
+    args = parser.parse_args()
+
+    scripts = [("current", FRONTEND)]
+    if args.baseline:
+        scripts.insert(0, (args.baseline, baseline_script(args.baseline)))
+
+    server = start_stub_api()
+    try:
+        print(f"{'frontend':>10} {'tasks':>6} {'first run':>10} {'rerun':>8} {'buttons':>8}")
+        for count in args.tasks:
+            stub_tasks[:] = make_tasks(count)
+            for name, path in scripts:
+                first, rerun, buttons = time_script(path)
+                print(f"{name:>10} {count:>6} {first:>9.2f}s {rerun:>7.2f}s {buttons:>8}")
+    finally:
+        server.shutdown()
+        if args.baseline:
+            os.remove(scripts[0][1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Compare jsonify, dump_json and a cached payload for large task lists.
+
+Run from the repo root: python benchmarks/bench_serialization.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "final_chatbot"))
+
+from flask import Flask, jsonify
+from json_payloads import PayloadCache, dump_json, orjson
+
+
+def make_tasks(count):
+    return [{
+        "id": i,
+        "task": f"Task {i}",
+        "date": "2026-10-20",
+        "time": "09:00",
+        "priority": "High",
+        "reminder": i % 2 == 0,
+        "status": "pending",
+        "created_at": "2026-10-19 08:00:00"
+    } for i in range(1, count + 1)]
+
+
+def best_of(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    app = Flask(__name__)
+    print(f"dump_json backend: {'orjson' if orjson else 'json (stdlib)'}")
+    print(f"{'tasks':>8} {'jsonify':>10} {'dump_json':>10} {'cache hit':>10}")
+    with app.app_context():
+        for count in (10_000, 100_000):
+            tasks = make_tasks(count)
+            cache = PayloadCache()
+            cache.get("schedule", lambda: {"tasks": tasks})
+
+            jsonify_ms = best_of(lambda: jsonify({"tasks": tasks}).get_data())
+            dump_ms = best_of(lambda: dump_json({"tasks": tasks}))
+            hit_ms = best_of(lambda: cache.get("schedule", lambda: {"tasks": tasks}))
+            print(f"{count:>8} {jsonify_ms:>8.2f}ms {dump_ms:>8.2f}ms {hit_ms:>8.4f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Outbound SMS calls with one reminder per task vs per-recipient digests, against a fake sender.
+
+Run from the repo root: python benchmarks/bench_sms_digest.py
+"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "SMS_REM"))
+
+from sms_reminders import collect_due_reminders, send_reminder_digests, sms_segments
+
+START = datetime(2030, 1, 1, 8, 50)
+
+
+class FakeTransport:
+    def __init__(self):
+        self.messages = []
+
+    def send(self, phone, message):
+        self.messages.append((phone, message))
+        return True
+
+
+def make_tasks(recipients, per_recipient):
+    random.seed(1)
+    tasks = []
+    for recipient in range(recipients):
+        for i in range(per_recipient):
+            start = START + timedelta(minutes=10 + random.randint(0, 9))  # Tasks between 9:00 and 9:09
+            tasks.append({
+                "id": len(tasks) + 1,
+                "task": f"Task number {i}",
+                "date": start.strftime("%Y-%m-%d"),
+                "time": start.strftime("%H:%M"),
+                "reminder": True,
+                "phone": f"9{recipient:09d}",
+                "status": "pending"
+            })
+    return tasks
+
+
+def run_per_task(tasks):
+    """ The old scheduler: one SMS for every task whose reminder is due this minute """
+    transport = FakeTransport()
+    for minute in range(20):
+        for phone, due_tasks in collect_due_reminders(tasks, START + timedelta(minutes=minute), 1).items():
+            for task in due_tasks:
+                transport.send(phone, f"Reminder: {task['task']} is scheduled at {task['time']} on {task['date']}.")
+                task["notified"] = True
+    assert all(task.get("notified") for task in tasks)
+    return transport.messages
+
+
+def run_digests(tasks, window_minutes=10):
+    transport = FakeTransport()
+    for minute in range(20):
+        send_reminder_digests(tasks, START + timedelta(minutes=minute), transport.send, window_minutes)
+    assert all(task.get("notified") for task in tasks)
+    return transport.messages
+
+
+def main():
+    print(f"{'recipients x tasks':>20} {'per task':>9} {'digests':>8} {'segments':>9}")
+    for recipients, per_recipient in ((50, 10), (50, 30)):
+        per_task = run_per_task(make_tasks(recipients, per_recipient))
+        digests = run_digests(make_tasks(recipients, per_recipient))
+        segments = sum(sms_segments(message) for _, message in digests)
+        print(f"{recipients:>9} x {per_recipient:<8} {len(per_task):>9} {len(digests):>8} {segments:>9}")
+
+
+if __name__ == "__main__":
+    main()
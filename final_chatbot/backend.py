@@ -1,12 +1,17 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import os
 import random
+import itertools
 import pandas as pd
 import spacy
 import google.generativeai as genai
 from datetime import datetime
 from dotenv import load_dotenv
+from date_normalizer import normalize, needs_fallback, parse_date, parse_time
+from conversation_memory import ConversationMemory
+from json_payloads import PayloadCache
+from task_batch import apply_batch, validate_batch
 
 # Load environment variables
 load_dotenv()
@@ -21,9 +26,37 @@ nlp = spacy.load("en_core_web_sm")
 
 # In-memory storage for tasks
 tasks = []
+# Task ids keep counting up, so an id is never reused after a delete
+task_ids = itertools.count(1)
 
-# Function to extract entities (Date, Time, Person) using spaCy
+# Server-side chat history, so follow-ups like "move it to 5 PM" reach Gemini with context
+conversations = ConversationMemory(
+    token_budget=int(os.getenv("CHAT_TOKEN_BUDGET", "1000")),
+    max_sessions=int(os.getenv("CHAT_MAX_SESSIONS", "1000")),
+    idle_seconds=int(os.getenv("CHAT_SESSION_IDLE_MINUTES", "60")) * 60
+)
+
+# Encoded /schedule and /reminders payloads, reused until the task list changes
+payload_cache = PayloadCache()
+
+# Mark the task list as changed so cached payloads are rebuilt on the next request
+def mark_tasks_changed():
+    payload_cache.invalidate()
+
+def cached_payload(name, build):
+    return payload_cache.get(name, build)
+
+def json_response(body, status=200):
+    return Response(body, status=status, mimetype="application/json")
+
+# Function to extract entities (Date, Time, Person)
 def extract_entities(text):
+    # Fast path: the precompiled rules handle common phrasing without running spaCy
+    entities = normalize(text)
+    if entities["DATE"] or entities["TIME"] or not needs_fallback(text):
+        return entities
+
+    # Fallback: let spaCy find the entities, normalizing them where the rules can
     doc = nlp(text)
     date_entity = None
     time_entity = None
@@ -31,28 +64,36 @@ def extract_entities(text):
 
     for ent in doc.ents:
         if ent.label_ == "DATE":
-            date_entity = ent.text
+            date_entity = parse_date(ent.text.lower()) or ent.text
         elif ent.label_ == "TIME":
-            time_entity = ent.text
+            time_entity = parse_time(ent.text.lower()) or ent.text
         elif ent.label_ == "PERSON":
             person_entities.append(ent.text)
 
     return {
         "DATE": date_entity,
         "TIME": time_entity,
-        "PERSON": person_entities if person_entities else None
+        "PERSON": person_entities if person_entities else entities["PERSON"]
     }
 
-# Function to interact with Gemini AI
-def talk_with_gemini(user_input):
-    try:
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        response = model.generate_content(user_input)
+# Function to get Gemini's reply to a prompt (None if it is empty; API errors are raised)
+def gemini_reply(prompt):
+    model = genai.GenerativeModel("gemini-2.0-flash")
+    response = model.generate_content(prompt)
+
+    if hasattr(response, "text") and response.text:
+        return response.text.strip()
+    return None
 
-        if hasattr(response, "text") and response.text:
-            return response.text.strip()
+# Function to interact with Gemini AI, with the conversation history when a session id is given
+def talk_with_gemini(user_input, session_id=None):
+    try:
+        # Failed or empty replies are not stored in the conversation history
+        if session_id:
+            reply = conversations.chat(session_id, user_input, gemini_reply)
         else:
-            return "Sorry, I couldn't process that. Try rephrasing!"
+            reply = gemini_reply(user_input)
+        return reply or "Sorry, I couldn't process that. Try rephrasing!"
     except Exception as e:
         return f"Error communicating with AI: {str(e)}"
 
@@ -62,7 +103,7 @@ def add_task():
     data = request.json
     try:
         task = {
-            "id": len(tasks) + 1,
+            "id": next(task_ids),
             "task": data["task"],
             "date": data.get("date", "Not specified"),
             "time": data["time"],
@@ -72,6 +113,7 @@ def add_task():
             "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
         tasks.append(task)
+        mark_tasks_changed()
         return jsonify({"message": "Task added successfully", "task": task}), 200
     except KeyError:
         return jsonify({"error": "Invalid task data"}), 400
@@ -79,13 +121,15 @@ def add_task():
 # Route to get scheduled tasks
 @app.route("/schedule", methods=["GET"])
 def get_schedule():
-    return jsonify({"tasks": tasks})
+    return json_response(cached_payload("schedule", lambda: {"tasks": tasks}))
 
 # Route to get reminders
 @app.route("/reminders", methods=["GET"])
 def get_reminders():
-    reminders = [task for task in tasks if task.get("reminder", False)]
-    return jsonify({"reminders": reminders})
+    body = cached_payload("reminders", lambda: {
+        "reminders": [task for task in tasks if task.get("reminder", False)]
+    })
+    return json_response(body)
 
 # Route to mark a task as completed
 @app.route("/complete-task/<int:task_id>", methods=["POST"])
@@ -93,6 +137,7 @@ def complete_task(task_id):
     for task in tasks:
         if task["id"] == task_id:
             task["status"] = "completed"
+            mark_tasks_changed()
             return jsonify({"message": "Task marked as completed"})
     return jsonify({"error": "Task not found"}), 404
 
@@ -103,6 +148,7 @@ def delete_task(task_id):
     task_to_delete = next((task for task in tasks if task["id"] == task_id), None)
     if task_to_delete:
         tasks.remove(task_to_delete)
+        mark_tasks_changed()
         return jsonify({"message": f"Task '{task_to_delete['task']}' deleted successfully"})
     return jsonify({"error": "Task not found"}), 404
 
@@ -117,27 +163,50 @@ def update_task(task_id):
             task["time"] = data.get("time", task["time"])
             task["priority"] = data.get("priority", task["priority"])
             task["reminder"] = data.get("reminder", task["reminder"])
+            mark_tasks_changed()
             return jsonify({"message": "Task updated successfully!", "task": task}), 200
     return jsonify({"error": "Task not found!"}), 404
 
+# Route to apply several task changes in one request
+@app.route("/batch-tasks", methods=["POST"])
+def batch_tasks():
+    data = request.get_json(silent=True)
+    error = validate_batch(data)
+    if error:
+        return jsonify({"error": f"Invalid batch data: {error}"}), 400
+
+    updated, completed, deleted = apply_batch(tasks, data)
+    if updated or completed or deleted:
+        mark_tasks_changed()
+    return jsonify({
+        "message": "Tasks updated successfully!",
+        "updated": updated,
+        "completed": completed,
+        "deleted": deleted
+    }), 200
+
 # Route for chatbot conversation
 @app.route("/daily-planner", methods=["POST"])
 def chatbot_response():
-    user_message = request.json.get("message", "").lower()
-    detected_entities = extract_entities(user_message)
+    original_message = request.json.get("message", "")
+    user_message = original_message.lower()
+    session_id = request.json.get("session_id")
+    # Entities are read from the message as typed, so capitalised names can be recognised
+    detected_entities = extract_entities(original_message)
 
     if "schedule" in user_message or "task" in user_message:
-        return jsonify({"response": get_schedule().json})
+        # Reuse the encoded schedule instead of serializing, parsing and re-serializing it
+        return json_response(cached_payload("chat_schedule", lambda: {"response": {"tasks": tasks}}))
 
-    response_text = talk_with_gemini(user_message)
+    response_text = talk_with_gemini(user_message, session_id)
     
     extracted_info = ""
     if detected_entities["PERSON"]:
-        extracted_info += f"👤 Person(s): {', '.join(detected_entities['PERSON'])}\n"
+        extracted_info += f"👤 **Person(s):** {', '.join(detected_entities['PERSON'])}\n"
     if detected_entities["DATE"]:
-        extracted_info += f"📅 Date: {detected_entities['DATE']}\n"
+        extracted_info += f"📅 **Date:** {detected_entities['DATE']}\n"
     if detected_entities["TIME"]:
-        extracted_info += f"⏰ Time: {detected_entities['TIME']}\n"
+        extracted_info += f"⏰ **Time:** {detected_entities['TIME']}\n"
 
     return jsonify({
         "response": response_text.strip(),
@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import OrderedDict, deque
+
+# Server-side chat memory for Gemini prompts.
+# Each session keeps its recent turns plus a rolling summary of older ones, and prompts
+# are built under a token budget so their size stays flat as a conversation grows.
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 characters per token), good enough for budgeting prompts."""
+    return max(1, len(text) // 4)
+
+
+def _clip(text, limit):
+    return text if len(text) <= limit else text[:limit - 3].rstrip() + "..."
+
+
+def summarize_turns(summary, turns):
+    """Fold dropped turns into the running summary with one short line per exchange."""
+    lines = [summary] if summary else []
+    for user_message, reply in turns:
+        lines.append(f"- User: {_clip(user_message, 80)} / Assistant: {_clip(reply, 80)}")
+    return "\n".join(lines)
+
+
+class ConversationMemory:
+    def __init__(self, token_budget=1000, max_sessions=1000, idle_seconds=3600,
+                 max_turns=20, summarize=summarize_turns, clock=time.monotonic):
+        self.token_budget = token_budget
+        self.max_sessions = max_sessions
+        self.idle_seconds = idle_seconds
+        self.max_turns = max_turns
+        self.summarize = summarize
+        self.clock = clock
+        self.sessions = OrderedDict()  # session_id -> {"turns", "summary", "last_seen"}, least recently used first
+        self.lock = threading.Lock()
+
+    def _evict(self, now):
+        # Sessions are kept in last-used order, so idle ones are always at the front
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if len(self.sessions) <= self.max_sessions and now - session["last_seen"] < self.idle_seconds:
+                break
+            del self.sessions[session_id]
+
+    def _session(self, session_id):
+        now = self.clock()
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            session = {"turns": deque(), "summary": "", "last_seen": now}
+        session["last_seen"] = now
+        self.sessions[session_id] = session
+        self._evict(now)
+        return session
+
+    def _fold(self, session, count):
+        dropped = [session["turns"].popleft() for _ in range(count)]
+        summary = self.summarize(session["summary"], dropped)
+
+        # The summary may use a quarter of the budget (~4 characters per token); keep its newest whole lines
+        limit = self.token_budget
+        kept, size = [], 0
+        for line in reversed(summary.split("\n")):
+            if size + len(line) + 1 > limit:
+                if not kept:
+                    kept.append(_clip(line, limit))
+                break
+            kept.append(line)
+            size += len(line) + 1
+        session["summary"] = "\n".join(reversed(kept))
+
+    def build_prompt(self, session_id, message):
+        """Build a prompt of summary + as many recent turns as fit the budget + the new message."""
+        header = "Recent conversation:"
+        # The new message may use half the budget, so summary + header + message always fit
+        message = _clip(message, self.token_budget * 2)
+        with self.lock:
+            session = self._session(session_id)
+            while True:
+                parts = [f"User: {message}"]
+                if session["summary"]:
+                    parts.insert(0, f"Summary of the earlier conversation:\n{session['summary']}")
+                remaining = self.token_budget - sum(estimate_tokens(part) for part in parts + [header])
+
+                recent = []
+                for user_message, reply in reversed(session["turns"]):
+                    turn = f"User: {user_message}\nAssistant: {reply}"
+                    cost = estimate_tokens(turn)
+                    if cost > remaining:
+                        break
+                    recent.insert(0, turn)
+                    remaining -= cost
+
+                if len(recent) == len(session["turns"]):
+                    break
+                # Fold the turns that no longer fit into the summary, then rebuild with the new summary
+                self._fold(session, len(session["turns"]) - len(recent))
+
+        if recent:
+            parts.insert(-1, header + "\n" + "\n".join(recent))
+        return "\n\n".join(parts)
+
+    def record(self, session_id, message, reply):
+        """Store one exchange, folding the oldest turns into the summary past `max_turns`.
+
+        Each side is clipped to a quarter of the budget so one huge message can't pin memory or crowd out the history.
+        """
+        with self.lock:
+            session = self._session(session_id)
+            session["turns"].append((_clip(message, self.token_budget), _clip(reply, self.token_budget)))
+            if len(session["turns"]) > self.max_turns:
+                self._fold(session, len(session["turns"]) - self.max_turns)
+
+    def chat(self, session_id, message, generate):
+        """Answer `message` with `generate(prompt)` and remember the exchange.
+
+        If `generate` raises or returns None, the exchange is not recorded and the error/None is passed on.
+        """
+        reply = generate(self.build_prompt(session_id, message))
+        if reply is not None:
+            self.record(session_id, message, reply)
+        return reply
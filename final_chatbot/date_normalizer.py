@@ -0,0 +1,229 @@
+import re
+from datetime import date, timedelta
+
+# Rule-based date/time normalizer used ahead of spaCy.
+# Turns phrases like "tomorrow at 3 pm" or "next monday" into ISO dates ("2025-03-10")
+# and 24-hour times ("15:00") so the frontend can prefill the task form, and picks out
+# people named after "with", "call" or "meet".
+
+WEEKDAYS = {
+    "monday": 0, "mon": 0, "tuesday": 1, "tue": 1, "tues": 1, "wednesday": 2, "wed": 2,
+    "thursday": 3, "thu": 3, "thurs": 3, "friday": 4, "fri": 4, "saturday": 5,
+    "sunday": 6
+}
+
+MONTHS = {
+    "january": 1, "jan": 1, "february": 2, "feb": 2, "march": 3, "mar": 3, "april": 4, "apr": 4,
+    "may": 5, "june": 6, "jun": 6, "july": 7, "jul": 7, "august": 8, "aug": 8,
+    "september": 9, "sep": 9, "sept": 9, "october": 10, "oct": 10, "november": 11, "nov": 11,
+    "december": 12, "dec": 12
+}
+
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6, "seven": 7,
+    "eight": 8, "nine": 9, "ten": 10
+}
+
+# Default clock times for parts of the day
+NAMED_TIMES = {
+    "noon": "12:00", "midnight": "00:00", "morning": "09:00", "afternoon": "15:00",
+    "evening": "18:00", "tonight": "20:00", "night": "21:00"
+}
+
+_WEEKDAY_NAMES = "|".join(sorted(WEEKDAYS, key=len, reverse=True))
+_MONTH_NAMES = "|".join(sorted(MONTHS, key=len, reverse=True))
+_NUMBER_NAMES = "|".join(NUMBER_WORDS)
+
+# Dates, tried in order; the first match wins
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{1,2})-(\d{1,2})\b")
+# day/month[/year]; not "24/7" or "1/2 hour", so without a year it needs "on", "by", ... before it
+_NUMERIC_DATE = re.compile(r"\b(\d{1,2})/(\d{1,2})(?:/(\d{2,4}))?\b(?! ?(?:hours?|hrs?|minutes?|mins?|days?|weeks?)\b)")
+_DATE_CONTEXT = re.compile(r"\b(?:on|by|due|before|until|till)\s*$")
+_DAY_MONTH = re.compile(rf"\b(\d{{1,2}})(?:st|nd|rd|th)?(?: of)? ({_MONTH_NAMES})\b(?:,? (\d{{4}}))?")
+_MONTH_DAY = re.compile(rf"\b({_MONTH_NAMES}) (\d{{1,2}})(st|nd|rd|th)?\b(?:,? (\d{{4}}))?")
+_RELATIVE_DAY = re.compile(r"\b(day after tomorrow|today|tonight|tomorrow|tmrw|tmr|yesterday)\b")
+_IN_DAYS = re.compile(rf"\bin (\d+|{_NUMBER_NAMES}) (days?|weeks?)\b")
+_WEEKDAY = re.compile(rf"\b(?:(next|this|coming|every) )?({_WEEKDAY_NAMES})\b")
+_WEEKEND = re.compile(r"\b(?:this |next )?weekend\b")
+_NEXT_WEEK = re.compile(r"\bnext week\b")
+_DAY_OF_MONTH = re.compile(r"\b(?:on )?the (\d{1,2})(?:st|nd|rd|th)\b")
+
+# Times
+_CLOCK_12H = re.compile(r"\b(\d{1,2})(?:[:.](\d{2}))? ?([ap])\.?m\b\.?")
+_AT_CLOCK = re.compile(r"\bat ([01]?\d|2[0-3])(?::([0-5]\d))?(?: o'?clock)?\b(?![./\d])")
+_CLOCK_24H = re.compile(r"\b([01]?\d|2[0-3]):([0-5]\d)\b")
+_NAMED_TIME = re.compile(r"(?<!good )\b(noon|midnight|morning|afternoon|evening|tonight|night)\b")
+
+# Part-of-day words that settle whether an hour without am/pm is AM or PM
+_MORNING_WORDS = {"morning"}
+_PM_WORDS = {"afternoon", "evening", "tonight", "night"}
+
+# People: a capitalised name after "with", "call", "meet", ... (needs the original-case text)
+_PERSON = re.compile(r"\b(?i:with|call|meet|email|text|ask|tell) ([A-Z][a-z'-]+)(?: ([A-Z][a-z'-]+))?")
+NOT_NAMES = {
+    "the", "with", "my", "a", "an", "your", "our", "his", "her", "their", "me", "him", "them", "us", "you", "it",
+    "this", "that", "all", "everyone", "team", "friends", "family", "colleagues", "client", "clients",
+    "boss", "manager", "doctor", "at", "on", "in", "for", "to", "about", "and", "tomorrow", "today",
+    "tonight", "back", "up", "some", "someone", "people", "every", "later", "now", "again", "soon",
+    "before", "after", "from", "regarding", "by"
+}
+
+# Words that suggest a date/time the rules above may have missed; only then is spaCy worth running
+# ("may" is left out: on its own it is almost always the verb)
+_HINT_MONTH_NAMES = "|".join(sorted(set(MONTHS) - {"may"}, key=len, reverse=True))
+_DATETIME_HINT = re.compile(
+    rf"\d|\b(?:{_HINT_MONTH_NAMES}|{_WEEKDAY_NAMES}|week|weekdays?|month|year|hours?|minutes?|days?)\b"
+)
+
+
+def _number(value):
+    return NUMBER_WORDS[value] if value in NUMBER_WORDS else int(value)
+
+
+def _safe_date(year, month, day):
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _with_year(today, month, day, year=None):
+    """Build a date, rolling over to next year when no year is given and the date has passed."""
+    if year:
+        year = int(year)
+        return _safe_date(year + 2000 if year < 100 else year, month, day)
+    candidate = _safe_date(today.year, month, day)
+    if candidate and candidate < today:
+        candidate = _safe_date(today.year + 1, month, day)
+    return candidate
+
+
+def _next_weekday(today, weekday, skip_this_week=False):
+    days_ahead = (weekday - today.weekday()) % 7
+    if skip_this_week:
+        days_ahead = days_ahead or 7
+    return today + timedelta(days=days_ahead)
+
+
+def parse_date(text, today=None):
+    """Return the ISO date mentioned in `text`, or None if no rule matches."""
+    today = today or date.today()
+
+    match = _ISO_DATE.search(text)
+    if match:
+        result = _safe_date(*map(int, match.groups()))
+        if result:
+            return result.isoformat()
+
+    match = _DAY_MONTH.search(text)
+    if match:
+        result = _with_year(today, MONTHS[match.group(2)], int(match.group(1)), match.group(3))
+        if result:
+            return result.isoformat()
+
+    for match in _MONTH_DAY.finditer(text):
+        month, day, ordinal, year = match.groups()
+        # "may" is usually the verb ("i may 2 go"), so it needs an ordinal, a year or "on" before it
+        if month == "may" and not (ordinal or year or text[:match.start()].endswith("on ")):
+            continue
+        result = _with_year(today, MONTHS[month], int(day), year)
+        if result:
+            return result.isoformat()
+
+    for match in _NUMERIC_DATE.finditer(text):
+        if not (match.group(3) or _DATE_CONTEXT.search(text[:match.start()])):
+            continue
+        result = _with_year(today, int(match.group(2)), int(match.group(1)), match.group(3))
+        if result:
+            return result.isoformat()
+
+    match = _RELATIVE_DAY.search(text)
+    if match:
+        offset = {"day after tomorrow": 2, "tomorrow": 1, "tmrw": 1, "tmr": 1, "yesterday": -1}
+        return (today + timedelta(days=offset.get(match.group(1), 0))).isoformat()
+
+    match = _IN_DAYS.search(text)
+    if match:
+        days = _number(match.group(1)) * (7 if match.group(2).startswith("week") else 1)
+        return (today + timedelta(days=days)).isoformat()
+
+    match = _WEEKDAY.search(text)
+    if match:
+        return _next_weekday(today, WEEKDAYS[match.group(2)], match.group(1) == "next").isoformat()
+
+    if _WEEKEND.search(text):
+        return _next_weekday(today, 5).isoformat()
+
+    if _NEXT_WEEK.search(text):
+        return _next_weekday(today, 0, skip_this_week=True).isoformat()
+
+    match = _DAY_OF_MONTH.search(text)
+    if match:
+        day = int(match.group(1))
+        result = _safe_date(today.year, today.month, day)
+        if not result or result < today:
+            next_month = date(today.year + today.month // 12, today.month % 12 + 1, 1)
+            result = _safe_date(next_month.year, next_month.month, day)
+        if result:
+            return result.isoformat()
+
+    return None
+
+
+def parse_time(text):
+    """Return the first time mentioned in `text` as "HH:MM", or None if no rule matches."""
+    match = _CLOCK_12H.search(text)
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2) or 0)
+        if 1 <= hour <= 12 and minute < 60:
+            hour = hour % 12 + (12 if match.group(3) == "p" else 0)
+            return f"{hour:02d}:{minute:02d}"
+
+    named = _NAMED_TIME.search(text)
+    part_of_day = named.group(1) if named else None
+
+    match = _AT_CLOCK.search(text) or _CLOCK_24H.search(text)
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2) or 0)
+        if part_of_day in _PM_WORDS and hour < 12:
+            hour += 12
+        elif part_of_day is None and match.re is _AT_CLOCK and 1 <= hour < 8:
+            # Without am/pm, "at 1".."at 7" means afternoon/evening, as people rarely schedule at 3 AM
+            hour += 12
+        # "in the morning" keeps the hour as AM
+        return f"{hour:02d}:{minute:02d}"
+
+    if part_of_day:
+        return NAMED_TIMES[part_of_day]
+
+    return None
+
+
+def _is_name(word):
+    word = word.lower()
+    return word not in NOT_NAMES and word not in WEEKDAYS and word not in MONTHS
+
+
+def parse_people(text):
+    """Return the capitalised names in `text` after words like "with" or "call" (original case, not lowercased)."""
+    people = []
+    for match in _PERSON.finditer(text):
+        first, last = match.groups()
+        if not _is_name(first):
+            continue
+        people.append(f"{first} {last}" if last and _is_name(last) else first)
+    return people
+
+
+def normalize(text, today=None):
+    """Normalize `text` to {"DATE": "YYYY-MM-DD" | None, "TIME": "HH:MM" | None, "PERSON": [names] | None}.
+
+    Pass the message as the user typed it: names are only recognised when capitalised.
+    """
+    lowered = text.lower()
+    return {"DATE": parse_date(lowered, today), "TIME": parse_time(lowered), "PERSON": parse_people(text) or None}
+
+
+def needs_fallback(text):
+    """True if `text` looks like it mentions a date/time that the rules could not normalize."""
+    return bool(_DATETIME_HINT.search(text.lower()))
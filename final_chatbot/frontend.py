@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+import uuid
 import pandas as pd
 from datetime import datetime
 
@@ -64,88 +65,117 @@ if "messages" not in st.session_state:
         "content": "👋 Hello! Ask me anything about scheduling tasks or general knowledge!"
     }]
 
+# Identifies this chat to the backend, which keeps the conversation history
+if "session_id" not in st.session_state:
+    st.session_state["session_id"] = uuid.uuid4().hex
+
+# 🔹 Fetch the task list from the backend (None if the request fails)
+def fetch_tasks():
+    response = requests.get(f"{API_URL}/schedule")
+    if response.status_code == 200:
+        return response.json().get("tasks", [])
+    return None
+
+# 🔹 Parse a stored "YYYY-MM-DD" / "HH:MM" value (None if it is missing or malformed)
+def parse_task_value(value, fmt):
+    try:
+        return datetime.strptime(value, fmt)
+    except (TypeError, ValueError):
+        return None
+
+# Longest task list shown per sidebar section; the full list is managed in Schedule Overview
+SIDEBAR_TASK_LIMIT = 10
+
+def sidebar_list(items, render):
+    for item in items[:SIDEBAR_TASK_LIMIT]:
+        st.write(render(item))
+    if len(items) > SIDEBAR_TASK_LIMIT:
+        st.caption(f"…and {len(items) - SIDEBAR_TASK_LIMIT} more in 📊 Schedule Overview")
+
 # 🔹 Sidebar Information
-st.sidebar.title("📜 Task History")
-st.sidebar.info("""
+# Each region below is an st.fragment, so interacting with one only reruns that region.
+# Changes to the task list still trigger a full rerun so every region shows the new schedule.
+@st.fragment
+def render_sidebar():
+    st.title("📜 Task History")
+    st.info("""
 **Task Genie** helps you:
 - 📝 Schedule tasks efficiently
 - ⏰ Set reminders for key activities
 - ✅ Track and manage tasks with ease
 """)
+    # Clicking a button inside a fragment already reruns just the fragment
+    st.button("🔄 Refresh", key="refresh_sidebar")
 
-# Fetch Tasks & Reminders
-try:
-    history_response = requests.get(f"{API_URL}/schedule")
-    reminders_response = requests.get(f"{API_URL}/reminders")
-
-    # 🎯 Display Scheduled & Completed Tasks
-    if history_response.status_code == 200:
-        tasks = history_response.json().get("tasks", [])
+    # Fetch Tasks & Reminders
+    try:
+        tasks = fetch_tasks()
+        reminders_response = requests.get(f"{API_URL}/reminders")
 
-        if tasks:
+        # 🎯 Display Scheduled & Completed Tasks
+        if tasks is None:
+            st.error("⚠️ Unable to load scheduled tasks.")
+        elif tasks:
             # Categorize tasks
             today = datetime.today().date()
             pending_tasks = [task for task in tasks if task["status"] == "pending"]
             completed_tasks = [task for task in tasks if task["status"] == "completed"]
-            overdue_tasks = [task for task in pending_tasks if datetime.strptime(task["date"], "%Y-%m-%d").date() < today]
+            overdue_tasks = [
+                task for task in pending_tasks
+                if (task_date := parse_task_value(task["date"], "%Y-%m-%d")) and task_date.date() < today
+            ]
 
             # 🔴 Overdue Tasks (Highlighted)
             if overdue_tasks:
-                st.sidebar.markdown("### 🔴 Overdue Tasks")
-                for idx, task in enumerate(overdue_tasks):
-                    st.sidebar.write(f"⏳ **{task['task']}** - {task['date']} ({task['priority']})")
+                st.markdown("### 🔴 Overdue Tasks")
+                sidebar_list(overdue_tasks, lambda task: f"⏳ **{task['task']}** - {task['date']} ({task['priority']})")
 
-            # 🟡 Scheduled Tasks
+            # 🟡 Scheduled Tasks (complete or delete them in Schedule Overview)
             if pending_tasks:
-                st.sidebar.markdown("### 🟡 Scheduled Tasks")
-                for idx, task in enumerate(pending_tasks):
-                    st.sidebar.write(f"📌 {task['task']} - {task['date']} ({task['priority']})")
-
-                    # Ensure unique keys using index + task ID
-                    col1, col2 = st.sidebar.columns([1, 1])
-                    with col1:
-                        if st.button("✅ Done", key=f"complete_{task['id']}_{idx}"):
-                            requests.post(f"{API_URL}/complete-task/{task['id']}")
-                            st.rerun()
-                    with col2:
-                        if st.button("🗑️ Delete", key=f"delete_{task['id']}_{idx}"):
-                            requests.delete(f"{API_URL}/delete-task/{task['id']}")
-                            st.rerun()
+                st.markdown("### 🟡 Scheduled Tasks")
+                sidebar_list(pending_tasks, lambda task: f"📌 {task['task']} - {task['date']} ({task['priority']})")
 
             # ✅ Completed Tasks
             if completed_tasks:
-                st.sidebar.markdown("### ✅ Completed Tasks")
-                for idx, task in enumerate(completed_tasks):
-                    st.sidebar.write(f"✔️ {task['task']} - {task['date']}")
+                st.markdown("### ✅ Completed Tasks")
+                sidebar_list(completed_tasks, lambda task: f"✔️ {task['task']} - {task['date']}")
 
         else:
-            st.sidebar.info("No tasks found. Add new tasks using Task Genie! ✅")
+            st.info("No tasks found. Add new tasks using Task Genie! ✅")
 
-    else:
-        st.sidebar.error("⚠️ Unable to load scheduled tasks.")
+        # 🔔 Display Reminders
+        st.markdown("### 🔔 Active Reminders")
+        if reminders_response.status_code == 200:
+            reminders = reminders_response.json().get("reminders", [])
 
-    # 🔔 Display Reminders
-    st.sidebar.markdown("### 🔔 Active Reminders")
-    if reminders_response.status_code == 200:
-        reminders = reminders_response.json().get("reminders", [])
+            if reminders:
+                sidebar_list(reminders, lambda reminder: f"⏰ **{reminder['task']}** - {reminder['time']} ({reminder['priority']})")
+            else:
+                st.info("No active reminders.")
 
-        if reminders:
-            for idx, reminder in enumerate(reminders):
-                st.sidebar.write(f"⏰ **{reminder['task']}** - {reminder['time']} ({reminder['priority']})")
         else:
-            st.sidebar.info("No active reminders.")
+            st.error("⚠️ Unable to load reminders.")
 
-    else:
-        st.sidebar.error("⚠️ Unable to load reminders.")
+    except requests.exceptions.ConnectionError:
+        st.error("📡 Connection failed. Check the API server status.")
+
+with st.sidebar:
+    render_sidebar()
 
-except requests.exceptions.ConnectionError:
-    st.sidebar.error("📡 Connection failed. Check the API server status.")
-    
     # 🔹 Tabs
 tab1, tab2, tab3 = st.tabs(["🎯 Chat & Plan", "📊 Schedule Overview", "📖 Help & Guide"])
 
+# 🔹 Check that an extracted date/time can prefill the task form
+def is_valid_datetime(value, fmt):
+    try:
+        datetime.strptime(value, fmt)
+        return True
+    except ValueError:
+        return False
+
 # 📌 Chat & Planning
-with tab1:
+@st.fragment
+def render_chat():
     # Display chat messages
     for msg in st.session_state.messages:
         with st.chat_message(msg["role"]):
@@ -161,7 +191,7 @@ with tab1:
             bot_response = knowledge_base[lower_input]
         else:
             try:
-                response = requests.post(f"{API_URL}/daily-planner", json={"message": user_input})
+                response = requests.post(f"{API_URL}/daily-planner", json={"message": user_input, "session_id": st.session_state["session_id"]})
                 response.raise_for_status()
                 response_data = response.json()
                 bot_response = response_data.get("response", "I'm not sure how to respond.")
@@ -178,20 +208,22 @@ with tab1:
                 # Automatically open the task form if a date/time is detected
                 if extracted_info and extracted_info != "No specific details detected.":
                     st.session_state["show_task_form"] = True
-                    # Extract the detected date/time
+                    # Extract the detected date/time (only values the form can use)
                     if "📅 **Date:**" in extracted_info:
                         detected_date = extracted_info.split("📅 **Date:**")[1].split("\n")[0].strip()
-                        st.session_state["extracted_date"] = detected_date
+                        if is_valid_datetime(detected_date, "%Y-%m-%d"):
+                            st.session_state["extracted_date"] = detected_date
                     if "⏰ **Time:**" in extracted_info:
                         detected_time = extracted_info.split("⏰ **Time:**")[1].split("\n")[0].strip()
-                        st.session_state["extracted_time"] = detected_time
+                        if is_valid_datetime(detected_time, "%H:%M"):
+                            st.session_state["extracted_time"] = detected_time
 
             except requests.exceptions.RequestException as e:
                 bot_response = f"❌ API request failed: {e}"
 
-        # Append bot response and rerun
+        # Append bot response and rerun only the chat
         st.session_state.messages.append({"role": "assistant", "content": bot_response})
-        st.rerun()
+        st.rerun(scope="fragment")
 
     # 🔹 Add a Task
     st.markdown("## ✏️ Add a New Task")
@@ -225,85 +257,86 @@ with tab1:
                     st.error("❌ Failed to add task.")
             except requests.exceptions.RequestException:
                 st.error("❌ Could not connect to the server.")
+
+with tab1:
+    render_chat()
+
+# 🔹 Collect the edits made in the schedule editor into one batch request
+def collect_schedule_changes(original, edited):
+    changes = {"complete": [], "delete": [], "update": []}
+    formats = {"task": None, "date": "%Y-%m-%d", "time": "%H:%M", "priority": None}
+
+    for before, after in zip(original.to_dict("records"), edited.to_dict("records")):
+        if after["delete"]:
+            changes["delete"].append(int(before["id"]))
+            continue
+        if after["complete"] and before["status"] == "pending":
+            changes["complete"].append(int(before["id"]))
+
+        # Cleared cells are ignored; dates and times go back to the backend as strings
+        update = {
+            field: after[field].strftime(fmt) if fmt else after[field]
+            for field, fmt in formats.items()
+            if not pd.isna(after[field]) and after[field] != before[field]
+        }
+        if update:
+            changes["update"].append({"id": int(before["id"]), **update})
+
+    return changes
+
 # 📌 Schedule Overview
-with tab2:
+@st.fragment
+def render_schedule():
     st.markdown("## 📊 Schedule Overview")
 
     try:
-        schedule_response = requests.get(f"{API_URL}/schedule")
-        if schedule_response.status_code == 200:
-            tasks = schedule_response.json().get("tasks", [])
-            
-            if tasks:
-                df = pd.DataFrame(tasks)
-                st.dataframe(df[['task', 'date', 'time', 'priority', 'status']])
-
-                for task in tasks:
-                    col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-
-                    with col1:
-                        st.write(f"📅 {task['date']} - **{task['task']}** - 🕒 {task['time']} ({task['priority']})")
-
-                    with col2:
-                        if task["status"] == "pending":
-                            if st.button("✅ Complete", key=f"complete_{task['id']}"):
-                                complete_response = requests.post(f"{API_URL}/complete-task/{task['id']}")
-                                if complete_response.status_code == 200:
-                                    st.success("🎉 Task marked as completed!")
-                                    st.rerun()
-                                else:
-                                    st.error("❌ Failed to update status.")
-
-                    with col3:
-                        if st.button("🗑️ Delete", key=f"delete_{task['id']}"):
-                            delete_response = requests.delete(f"{API_URL}/delete-task/{task['id']}")
-                            if delete_response.status_code == 200:
-                                st.success("✅ Task deleted successfully!")
-                                st.rerun()
-                            else:
-                                st.error("❌ Failed to delete task.")
-
-                    with col4:
-                        if st.button("✏️ Edit", key=f"edit_{task['id']}"):
-                            st.session_state["edit_task_id"] = task["id"]
-                            st.session_state["edit_task_name"] = task["task"]
-                            st.session_state["edit_task_date"] = task["date"]
-                            st.session_state["edit_task_time"] = task["time"]
-                            st.session_state["edit_task_priority"] = task["priority"]
-
-                # Check if a task is selected for editing
-                if "edit_task_id" in st.session_state:
-                    st.markdown("## 📝 Edit Task")
-
-                    with st.form("edit_task_form", clear_on_submit=False):
-                        new_task_name = st.text_input("Task Name", st.session_state["edit_task_name"])
-                        new_task_date = st.date_input("Select Date", datetime.strptime(st.session_state["edit_task_date"], "%Y-%m-%d").date())
-                        new_task_time = st.time_input("Select Time", datetime.strptime(st.session_state["edit_task_time"], "%H:%M").time())
-                        new_priority = st.selectbox("Priority", ["Low", "Medium", "High"], 
-                                                    index=["Low", "Medium", "High"].index(st.session_state["edit_task_priority"]))
-
-                        update_button = st.form_submit_button("💾 Update Task")
-
-                        if update_button:
-                            updated_task = {
-                                "task": new_task_name,
-                                "date": new_task_date.strftime("%Y-%m-%d"),
-                                "time": new_task_time.strftime("%H:%M"),
-                                "priority": new_priority
-                            }
-
-                            update_response = requests.put(f"{API_URL}/update-task/{st.session_state['edit_task_id']}", json=updated_task)
-
-                            if update_response.status_code == 200:
-                                st.success("✅ Task updated successfully!")
-                                del st.session_state["edit_task_id"]  # Remove edit state
-                                st.rerun()
-                            else:
-                                st.error("❌ Failed to update task.")
+        tasks = fetch_tasks()
+        if tasks:
+            df = pd.DataFrame(tasks)[["id", "task", "date", "time", "priority", "status"]]
+            # Real date/time values let the editor use pickers, so edits can't produce malformed strings
+            df["date"] = [parsed.date() if (parsed := parse_task_value(value, "%Y-%m-%d")) else None for value in df["date"]]
+            df["time"] = [parsed.time() if (parsed := parse_task_value(value, "%H:%M")) else None for value in df["time"]]
+            df["complete"] = df["status"] == "completed"
+            df["delete"] = False
+
+            # One editable table replaces the per-task Complete / Delete / Edit buttons
+            edited_df = st.data_editor(
+                df,
+                key="schedule_editor",
+                hide_index=True,
+                disabled=["id", "status"],
+                column_order=["complete", "task", "date", "time", "priority", "status", "delete"],
+                column_config={
+                    "complete": st.column_config.CheckboxColumn("✅ Complete"),
+                    "task": st.column_config.TextColumn("Task", required=True),
+                    "date": st.column_config.DateColumn("📅 Date", format="YYYY-MM-DD", required=True),
+                    "time": st.column_config.TimeColumn("🕒 Time", format="HH:mm", step=60, required=True),
+                    "priority": st.column_config.SelectboxColumn("Priority", options=["Low", "Medium", "High"], required=True),
+                    "status": st.column_config.TextColumn("Status"),
+                    "delete": st.column_config.CheckboxColumn("🗑️ Delete"),
+                },
+            )
+
+            changes = collect_schedule_changes(df, edited_df)
+            pending_count = sum(len(items) for items in changes.values())
+
+            if st.button(f"💾 Apply Changes ({pending_count})", disabled=not pending_count):
+                batch_response = requests.post(f"{API_URL}/batch-tasks", json=changes)
+                if batch_response.status_code == 200:
+                    st.success("✅ Tasks updated successfully!")
+                    del st.session_state["schedule_editor"]  # Reset the editor to the new schedule
+                    st.rerun()
+                else:
+                    st.error("❌ Failed to update tasks.")
+        elif tasks is None:
+            st.error("⚠️ Unable to load scheduled tasks.")
 
     except requests.exceptions.ConnectionError:
         st.error("📡 Connection failed.")
 
+with tab2:
+    render_schedule()
+
 # 📌 Help & Guide
 with tab3:
     st.markdown("""
@@ -0,0 +1,36 @@
+import json
+
+# Fast JSON encoding plus a cache of encoded responses for the task routes.
+
+# orjson is much faster for large task lists; fall back to the stdlib if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(payload):
+    """Serialize a payload to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class PayloadCache:
+    def __init__(self):
+        self.version = 0  # Bumped on every task mutation
+        self.payloads = {}  # name -> (version, encoded bytes)
+
+    def invalidate(self):
+        """Mark the task list as changed so cached payloads are rebuilt on the next request."""
+        self.version += 1
+
+    def get(self, name, build):
+        """Return the encoded payload for `name`, rebuilding it only if the tasks changed since it was cached."""
+        version = self.version
+        cached = self.payloads.get(name)
+        if cached and cached[0] == version:
+            return cached[1]
+        body = dump_json(build())
+        self.payloads[name] = (version, body)
+        return body
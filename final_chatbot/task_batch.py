@@ -0,0 +1,70 @@
+from datetime import datetime
+
+# Validation and application of /batch-tasks requests (several task changes in one call).
+
+PRIORITIES = ["Low", "Medium", "High"]
+
+
+def _is_task_id(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def validate_batch(data):
+    """Check a /batch-tasks body, returning an error message or None if it is valid."""
+    if not isinstance(data, dict):
+        return "request body must be a JSON object"
+
+    for key in ("complete", "delete", "update"):
+        if not isinstance(data.get(key, []), list):
+            return f"'{key}' must be a list"
+    for key in ("complete", "delete"):
+        if not all(_is_task_id(task_id) for task_id in data.get(key, [])):
+            return f"'{key}' must contain task ids"
+
+    for change in data.get("update", []):
+        if not isinstance(change, dict) or not _is_task_id(change.get("id")):
+            return "each update needs an integer 'id'"
+        if "task" in change and (not isinstance(change["task"], str) or not change["task"].strip()):
+            return "task name must be a non-empty string"
+        for field, fmt in (("date", "%Y-%m-%d"), ("time", "%H:%M")):
+            if field in change:
+                try:
+                    datetime.strptime(change[field], fmt)
+                except (TypeError, ValueError):
+                    return f"invalid {field} {change[field]!r}"
+        if "priority" in change and change["priority"] not in PRIORITIES:
+            return f"priority must be one of {', '.join(PRIORITIES)}"
+        if "reminder" in change and not isinstance(change["reminder"], bool):
+            return "reminder must be true or false"
+    return None
+
+
+def apply_batch(tasks, data):
+    """Apply a validated batch to `tasks` in place and return (updated, completed, deleted) counts.
+
+    Like the single-task routes, each id acts on the first task with that id only.
+    """
+    by_id = {}
+    for task in tasks:
+        by_id.setdefault(task["id"], task)
+
+    updated = completed = 0
+    for change in data.get("update", []):
+        task = by_id.get(change["id"])
+        if task:
+            task["task"] = change.get("task", task["task"])
+            task["date"] = change.get("date", task["date"])
+            task["time"] = change.get("time", task["time"])
+            task["priority"] = change.get("priority", task["priority"])
+            task["reminder"] = change.get("reminder", task["reminder"])
+            updated += 1
+
+    for task_id in set(data.get("complete", [])):
+        task = by_id.get(task_id)
+        if task and task["status"] != "completed":
+            task["status"] = "completed"
+            completed += 1
+
+    doomed = {id(by_id[task_id]) for task_id in set(data.get("delete", [])) if task_id in by_id}
+    tasks[:] = [task for task in tasks if id(task) not in doomed]
+    return updated, completed, len(doomed)
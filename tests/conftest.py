@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The apps are run as plain scripts from their own folders, so make their modules importable here
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for folder in ("final_chatbot", "SMS_REM"):
+    sys.path.insert(0, os.path.join(ROOT, folder))
@@ -0,0 +1,113 @@
+import pytest
+
+from conversation_memory import ConversationMemory, estimate_tokens, summarize_turns
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class StubModel:
+    def __init__(self):
+        self.prompts = []
+
+    def __call__(self, prompt):
+        self.prompts.append(prompt)
+        return f"Noted, this is reply number {len(self.prompts)} about your plans for the day."
+
+
+def test_follow_up_sees_previous_turn():
+    memory, model = ConversationMemory(), StubModel()
+    memory.chat("s1", "schedule gym tomorrow at 7 am", model)
+    memory.chat("s1", "move it to 5 pm", model)
+    assert "schedule gym tomorrow at 7 am" in model.prompts[-1]
+    assert model.prompts[-1].endswith("User: move it to 5 pm")
+
+
+def test_prompt_size_stays_flat_as_turns_grow():
+    memory, model = ConversationMemory(token_budget=300), StubModel()
+    for i in range(300):
+        memory.chat("s1", f"message {i} about the design review and its follow-ups", model)
+    sizes = [estimate_tokens(prompt) for prompt in model.prompts]
+    assert max(sizes[20:]) <= 300 * 1.05
+    assert max(sizes[200:]) - min(sizes[200:]) < 60
+
+
+def test_turn_that_stops_fitting_is_summarized_in_the_same_prompt():
+    summarize = lambda summary, turns: "\n".join(([summary] if summary else []) + [user for user, _ in turns])
+    memory, model = ConversationMemory(token_budget=30, summarize=summarize), StubModel()
+    for i in range(3):
+        memory.chat("s1", f"message {i}", model)
+    assert "Summary of the earlier conversation" in model.prompts[-1]
+    for i in range(2):
+        assert f"message {i}" in model.prompts[-1]
+
+
+def test_summary_is_trimmed_by_whole_lines():
+    summarize = lambda summary, turns: "\n".join(
+        ([summary] if summary else []) + [f"line {user_message} " + "x" * 30 for user_message, _ in turns]
+    )
+    memory = ConversationMemory(token_budget=100, max_turns=1, summarize=summarize)
+    for i in range(10):
+        memory.record("s1", f"m{i}", "ok")
+    summary = memory.sessions["s1"]["summary"]
+    assert len(summary) <= 100
+    assert all(line.startswith("line m") for line in summary.split("\n"))
+    assert summary.split("\n")[-1].startswith("line m8")
+
+
+def test_overlong_summary_line_is_clipped():
+    memory = ConversationMemory(token_budget=40, max_turns=1, summarize=lambda summary, turns: "y" * 200)
+    memory.record("s1", "a", "b")
+    memory.record("s1", "c", "d")
+    assert memory.sessions["s1"]["summary"] == "y" * 37 + "..."
+
+
+def test_huge_message_keeps_prompt_and_memory_bounded():
+    memory, model = ConversationMemory(token_budget=300), StubModel()
+    memory.chat("s1", "plan my week", model)
+    memory.chat("s1", "x" * 100000, model)
+    memory.chat("s1", "and tomorrow?", model)
+    assert all(estimate_tokens(prompt) <= 300 for prompt in model.prompts)
+    assert all(len(message) <= 300 and len(reply) <= 300 for message, reply in memory.sessions["s1"]["turns"])
+
+
+def test_least_recently_used_session_is_evicted():
+    memory, model = ConversationMemory(max_sessions=2), StubModel()
+    memory.chat("a", "hi", model)
+    memory.chat("b", "hi", model)
+    memory.chat("a", "again", model)
+    memory.chat("c", "hi", model)
+    assert list(memory.sessions) == ["a", "c"]
+
+
+def test_idle_sessions_are_evicted():
+    clock, model = FakeClock(), StubModel()
+    memory = ConversationMemory(idle_seconds=60, clock=clock)
+    memory.chat("a", "hi", model)
+    clock.now = 30
+    memory.chat("b", "hi", model)
+    clock.now = 61
+    memory.chat("c", "hi", model)
+    assert list(memory.sessions) == ["b", "c"]
+
+
+def test_failed_replies_are_not_recorded():
+    memory = ConversationMemory()
+    assert memory.chat("a", "hi", lambda prompt: None) is None
+
+    def failing(prompt):
+        raise RuntimeError("quota exceeded")
+
+    with pytest.raises(RuntimeError):
+        memory.chat("a", "hi again", failing)
+    assert not memory.sessions["a"]["turns"]
+
+
+def test_default_summary_has_one_line_per_exchange():
+    summary = summarize_turns("", [("plan my day", "sure"), ("add gym", "done")])
+    assert summary.split("\n") == ["- User: plan my day / Assistant: sure", "- User: add gym / Assistant: done"]
@@ -0,0 +1,78 @@
+from datetime import date
+
+import pytest
+
+from date_normalizer import needs_fallback, normalize
+
+TODAY = date(2026, 10, 19)  # a Monday
+
+# (message, expected date, expected time): phrasing from daily_planner_chatbot_dataset_extended.csv plus other common formats
+CASES = [
+    ("Remind me to drink water every 2 hours", None, None),
+    ("Schedule a meeting with John at 3 PM", None, "15:00"),
+    ("What's my schedule for today?", "2026-10-19", None),
+    ("Add grocery shopping to my to-do list", None, None),
+    ("Cancel my 5 PM workout session", None, "17:00"),
+    ("Wake me up at 6:30 AM", None, "06:30"),
+    ("Remind me to call mom every Sunday at 8 PM", "2026-10-25", "20:00"),
+    ("Suggest a morning routine for productivity", None, "09:00"),
+    ("Remind me to take my medicine at 9 AM and 9 PM", None, "09:00"),
+    ("Schedule a study session for 2 hours tomorrow", "2026-10-20", None),
+    ("Remind me to submit my assignment tomorrow at 10 AM", "2026-10-20", "10:00"),
+    ("What are my tasks for this weekend?", "2026-10-24", None),
+    ("Schedule a doctor’s appointment for next Monday at 4 PM", "2026-10-26", "16:00"),
+    ("Remind me to pay my electricity bill on the 5th of every month", "2026-11-05", None),
+    ("Cancel my lunch meeting with Sarah tomorrow", "2026-10-20", None),
+    ("Schedule a call with the project team at 5 PM on Wednesday", "2026-10-21", "17:00"),
+    ("Wake me up at 7 AM on weekdays and 9 AM on weekends", None, "07:00"),
+    ("Meeting on 25th December at 10:15", "2026-12-25", "10:15"),
+    ("dentist march 3rd 2027 at noon", "2027-03-03", "12:00"),
+    ("submit report on 2026-11-02 at 14:30", "2026-11-02", "14:30"),
+    ("call bank on 12/11 at 9.45 am", "2026-11-12", "09:45"),
+    ("gym in 3 days at 7", "2026-10-22", "19:00"),
+    ("gym at 6:30", None, "18:30"),
+    ("review in two weeks", "2026-11-02", None),
+    ("dinner tonight", "2026-10-19", "20:00"),
+    ("standup this friday at 11 o'clock", "2026-10-23", "11:00"),
+    ("day after tomorrow at 8 p.m.", "2026-10-21", "20:00"),
+    ("plan a trip next week", "2026-10-26", None),
+    ("concert on may 2", "2027-05-02", None),
+    ("i may 2 go to the gym", None, None),
+    ("good morning!", None, None),
+    ("good night genie", None, None),
+    ("wake me at 7 in the morning", None, "07:00"),
+    ("jog at 6 tomorrow morning", "2026-10-20", "06:00"),
+    ("dinner at 8 tonight", "2026-10-19", "20:00"),
+    ("support available 24/7", None, None),
+    ("take a 1/2 hour break", None, None),
+    ("rent due 3/4", "2027-04-03", None),
+    ("party on 5/6/2027", "2027-06-05", None),
+]
+
+
+@pytest.mark.parametrize("message, expected_date, expected_time", CASES)
+def test_normalizes_date_and_time(message, expected_date, expected_time):
+    entities = normalize(message, TODAY)
+    assert (entities["DATE"], entities["TIME"]) == (expected_date, expected_time)
+
+
+@pytest.mark.parametrize("message, people", [
+    ("Meeting with John tomorrow", ["John"]),
+    ("Schedule a meeting with John at 3 PM", ["John"]),
+    ("Lunch with John Smith on Friday", ["John Smith"]),
+    ("Call Mom at 8 PM", ["Mom"]),
+    ("Schedule a call with the project team at 5 PM", None),
+    ("meeting with john tomorrow", None),  # Lowercase words are never taken as names
+    ("email report to boss tomorrow", None),
+    ("call plumber at 5", None),
+    ("meet deadlines by friday", None),
+    ("Meet with The team by Friday", None),
+])
+def test_extracts_people(message, people):
+    assert normalize(message, TODAY)["PERSON"] == people
+
+
+def test_falls_back_only_for_unhandled_date_words():
+    assert needs_fallback("list my goals for this month")
+    assert not needs_fallback("add grocery shopping to my to-do list")
+    assert not needs_fallback("i may go")
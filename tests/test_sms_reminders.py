@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sms_reminders import build_reminder_digests, send_reminder_digests, sms_segments
+
+
+def make_task(task_id, time, phone="9876543210", name=None):
+    return {
+        "id": task_id,
+        "task": name or f"Task {task_id}",
+        "date": "2030-01-01",
+        "time": time,
+        "reminder": True,
+        "phone": phone,
+        "status": "pending"
+    }
+
+
+def test_sms_segments_counts_gsm7_extended_and_ucs2():
+    assert sms_segments("a" * 160) == 1
+    assert sms_segments("a" * 161) == 2
+    assert sms_segments("[" * 80) == 1  # Extended characters take two septets
+    assert sms_segments("[" * 81) == 2
+    assert sms_segments("`" + "a" * 69) == 1  # A backtick forces UCS-2
+    assert sms_segments("`" + "a" * 70) == 2
+
+
+def test_digests_stay_within_segment_limit():
+    tasks = [make_task(i, "09:00", name="Review {budget} | [draft] ~ €" * 2) for i in range(20)]
+    digests = build_reminder_digests(tasks, max_segments=2)
+    assert len(digests) > 1
+    assert all(sms_segments(message) <= 2 for message, _ in digests)
+    assert sum(len(batch) for _, batch in digests) == len(tasks)
+
+
+def test_reminders_are_coalesced_per_phone_and_marked_notified():
+    tasks = [make_task(1, "09:00"), make_task(2, "09:05"), make_task(3, "09:00", phone="9123456789")]
+    sent = []
+    count = send_reminder_digests(tasks, datetime(2030, 1, 1, 8, 50), lambda phone, message: sent.append(phone) or True)
+    assert count == 2
+    assert sorted(sent) == ["+919123456789", "+919876543210"]
+    assert all(task["notified"] for task in tasks)
+
+
+def test_failed_send_leaves_tasks_unnotified():
+    tasks = [make_task(1, "09:00")]
+    send_reminder_digests(tasks, datetime(2030, 1, 1, 8, 50), lambda phone, message: False)
+    assert not tasks[0].get("notified")
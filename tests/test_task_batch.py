@@ -0,0 +1,49 @@
+from task_batch import apply_batch, validate_batch
+
+
+def make_task(task_id, name):
+    return {"id": task_id, "task": name, "date": "2030-01-01", "time": "09:00",
+            "priority": "Low", "reminder": False, "status": "pending"}
+
+
+def test_applies_updates_completions_and_deletes():
+    tasks = [make_task(1, "a"), make_task(2, "b"), make_task(3, "c")]
+    counts = apply_batch(tasks, {
+        "complete": [1],
+        "delete": [3],
+        "update": [{"id": 2, "task": "b2", "time": "10:30", "priority": "High"}]
+    })
+    assert counts == (1, 1, 1)
+    assert [task["id"] for task in tasks] == [1, 2]
+    assert tasks[0]["status"] == "completed"
+    assert (tasks[1]["task"], tasks[1]["time"], tasks[1]["priority"]) == ("b2", "10:30", "High")
+
+
+def test_duplicate_ids_act_on_one_task_like_the_single_task_routes():
+    # Older task lists can hold reused ids ([1, 2, 3] -> delete 1 -> add -> [2, 3, 3])
+    tasks = [make_task(2, "b"), make_task(3, "c"), make_task(3, "new")]
+    assert apply_batch(tasks, {"delete": [3]}) == (0, 0, 1)
+    assert [task["task"] for task in tasks] == ["b", "new"]
+
+    tasks = [make_task(3, "c"), make_task(3, "new")]
+    apply_batch(tasks, {"update": [{"id": 3, "task": "renamed"}], "complete": [3]})
+    assert [(task["task"], task["status"]) for task in tasks] == [("renamed", "completed"), ("new", "pending")]
+
+
+def test_unknown_ids_are_ignored():
+    tasks = [make_task(1, "a")]
+    assert apply_batch(tasks, {"delete": [9], "complete": [9], "update": [{"id": 9, "task": "x"}]}) == (0, 0, 0)
+    assert len(tasks) == 1
+
+
+def test_rejects_malformed_batches():
+    assert validate_batch(None)
+    assert validate_batch({"complete": "1"})
+    assert validate_batch({"delete": [[1]]})
+    assert validate_batch({"delete": [True]})
+    assert validate_batch({"update": ["x"]})
+    assert validate_batch({"update": [{"id": 1, "date": "2026-19-99"}]})
+    assert validate_batch({"update": [{"id": 1, "time": None}]})
+    assert validate_batch({"update": [{"id": 1, "task": "  "}]})
+    assert validate_batch({"update": [{"id": 1, "priority": "Urgent"}]})
+    assert validate_batch({"complete": [1], "update": [{"id": 2, "date": "2026-01-02", "time": "09:30"}]}) is None